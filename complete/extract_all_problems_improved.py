@@ -8,30 +8,200 @@ import os
 import json
 import re
 from bs4 import BeautifulSoup, Comment
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import sys
 
-def clean_html_text(html_content):
+# Prefer lxml's C parser when available; fall back to the stdlib parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# pyahocorasick scans for every keyword in one pass over the content
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# orjson serializes in native code, several times faster than stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps(obj):
+    """Serialize to a compact JSON string with the fastest available encoder"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False)
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+_RE_FIRST_SECTION = re.compile(r'(Input|Constraints|入力|制約)', re.I)
+
+# Section-like words that disqualify text from being description or title
+_SECTION_WORDS = ('Input', 'Output', 'Constraints', 'Sample')
+_TITLE_EXCLUDES = frozenset(['Input', 'Output', 'Constraints', 'Sample Input', 'Sample Output'])
+_TITLE_TAGS = ('h1', 'h2', 'h3', 'title')
+
+def _is_title_candidate(tag):
+    """Match heading-like tags whose text could serve as a title"""
+    if tag.name not in _TITLE_TAGS:
+        return False
+    text = tag.get_text().strip()
+    return bool(text) and len(text) < 100 and text not in _TITLE_EXCLUDES
+
+# Standard sections with multiple language support. Output-like entries
+# come first so headers such as "Output for the Sample Input", which also
+# contain input-like words, classify as outputs in the fallback scan.
+_SECTION_MAPPINGS = {
+    'sample output': ['Sample Output', 'Sample Output 1', '出力例', 'sample output',
+                      'Output for the Sample Input', 'Output for Sample Input'],
+    'output': ['Output', '出力', 'output'],
+    'sample input': ['Sample Input', 'Sample Input 1', '入力例', 'sample input'],
+    'input': ['Input', '入力', 'input'],
+    'constraints': ['Constraints', '制約', 'constraints'],
+}
+
+_SECTION_HEADER_RES = {
+    key: re.compile('|'.join(re.escape(name) for name in names), re.I)
+    for key, names in _SECTION_MAPPINGS.items()
+}
+
+# Exact header text -> section key, for the common case
+_NAME_TO_KEY = {
+    name.lower(): key
+    for key, names in _SECTION_MAPPINGS.items()
+    for name in names
+}
+
+# Full two-sided ranges first so they win over the one-sided alternatives
+_RE_RANGE = re.compile(
+    r'(\d+)\s*[≤<=]\s*\w+\s*[≤<=]\s*(\d+)'
+    r'|\w+\s*[≤<=]\s*(\d+)'
+    r'|(\d+)\s*[≤<=]\s*\w+'
+)
+
+# Keyword-based assessment
+EASY_KEYWORDS = ['sum', 'count', 'simple', 'basic', 'digit', 'print', 'calculate', 'find']
+MEDIUM_KEYWORDS = ['algorithm', 'sort', 'search', 'tree', 'graph', 'dynamic', 'optimal', 'sequence']
+HARD_KEYWORDS = ['complex', 'advanced', 'polynomial', 'exponential', 'combinatorial', 'optimization']
+
+# Enhanced category detection
+CATEGORY_KEYWORDS = {
+    'Arrays & Strings': ['array', 'string', 'text', 'character', 'sequence', 'list'],
+    'Math & Logic': ['math', 'number', 'digit', 'calculate', 'formula', 'equation', 'arithmetic'],
+    'Geometry': ['triangle', 'circle', 'coordinate', 'distance', 'angle', 'geometry', 'point'],
+    'Sorting & Searching': ['sort', 'search', 'find', 'order', 'binary search', 'maximum', 'minimum'],
+    'Dynamic Programming': ['dynamic', 'dp', 'optimization', 'optimal', 'recursive'],
+    'Trees & Graphs': ['tree', 'graph', 'node', 'edge', 'path', 'traversal', 'connected'],
+    'Greedy Algorithms': ['greedy', 'optimal choice', 'interval'],
+    'Simulation': ['simulate', 'game', 'step', 'process', 'move'],
+    'Implementation': ['implement', 'program', 'algorithm', 'output', 'print']
+}
+
+TAG_KEYWORDS = {
+    'array': ['array', 'list', 'sequence'],
+    'string': ['string', 'text', 'character'],
+    'math': ['math', 'number', 'calculation', 'arithmetic'],
+    'geometry': ['triangle', 'circle', 'coordinate', 'geometry'],
+    'sorting': ['sort', 'order', 'maximum', 'minimum'],
+    'graph': ['graph', 'tree', 'node', 'path'],
+    'simulation': ['simulate', 'game', 'process'],
+    'implementation': ['implement', 'program', 'output']
+}
+
+_ALL_KEYWORDS = set(EASY_KEYWORDS) | set(MEDIUM_KEYWORDS) | set(HARD_KEYWORDS)
+for _keywords in CATEGORY_KEYWORDS.values():
+    _ALL_KEYWORDS.update(_keywords)
+for _keywords in TAG_KEYWORDS.values():
+    _ALL_KEYWORDS.update(_keywords)
+
+# Code templates are identical for every problem, so build them once
+CODE_TEMPLATES = {
+    'python': '''def solve():
+    # Read input
+    # Process data
+    # Output result
+    pass
+
+if __name__ == "__main__":
+    solve()''',
+
+    'cpp': '''#include <iostream>
+#include <vector>
+#include <string>
+using namespace std;
+
+int main() {
+    // Read input
+    // Process data
+    // Output result
+    return 0;
+}''',
+
+    'java': '''import java.util.*;
+import java.io.*;
+
+public class Solution {
+    public static void main(String[] args) {
+        Scanner sc = new Scanner(System.in);
+        // Read input
+        // Process data
+        // Output result
+        sc.close();
+    }
+}''',
+
+    'javascript': '''function solve() {
+    // Read input
+    // Process data
+    // Output result
+}
+
+solve();'''
+}
+
+def _build_keyword_automaton():
+    """Build an Aho-Corasick automaton over all known keywords"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in _ALL_KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+def _find_keywords(content):
+    """Find which known keywords appear in content in a single pass"""
+    if _KEYWORD_AUTOMATON is not None:
+        return {keyword for _, keyword in _KEYWORD_AUTOMATON.iter(content)}
+    # Fallback: per-keyword substring scans
+    return {keyword for keyword in _ALL_KEYWORDS if keyword in content}
+
+def _collapse_ws(text: str) -> str:
+    """Collapse runs of whitespace into single spaces"""
+    return _WHITESPACE_RE.sub(' ', text).strip()
+
+def clean_html_text(html_content: str) -> str:
     """Clean HTML content and extract plain text"""
     if not html_content:
         return ""
     
     # Parse HTML
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = BeautifulSoup(html_content, HTML_PARSER)
     
     # Remove script and style elements
     for script in soup(["script", "style"]):
         script.decompose()
     
-    # Get text and clean it
-    text = soup.get_text()
-    
-    # Clean up whitespace
-    lines = (line.strip() for line in text.splitlines())
-    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-    text = ' '.join(chunk for chunk in chunks if chunk)
-    
-    return text
+    # Get text and normalize whitespace in one regex pass
+    return _collapse_ws(soup.get_text())
 
 def extract_from_comments(soup):
     """Extract content from HTML comments"""
@@ -39,10 +209,9 @@ def extract_from_comments(soup):
     comment_content = []
     
     for comment in comments:
-        # Parse comment content as HTML
+        # Comments are already strings, so clean them directly
         try:
-            comment_soup = BeautifulSoup(comment, 'html.parser')
-            text = clean_html_text(str(comment_soup))
+            text = clean_html_text(comment)
             if text and len(text) > 20:  # Only meaningful content
                 comment_content.append(text)
         except:
@@ -54,8 +223,10 @@ def extract_title_flexible(soup):
     """Extract title using multiple strategies"""
     # Strategy 1: H1 tag
     title_tag = soup.find('h1')
-    if title_tag and title_tag.get_text().strip():
-        return clean_html_text(str(title_tag))
+    if title_tag:
+        title = _collapse_ws(title_tag.get_text())
+        if title:
+            return title
     
     # Strategy 2: Problem Statement section (AtCoder style)
     problem_section = soup.find('h3', string='Problem Statement')
@@ -69,11 +240,10 @@ def extract_title_flexible(soup):
                 if line.strip() and 'Problem Statement' not in line and len(line.strip()) < 100:
                     return line.strip()
     
-    # Strategy 3: Look for any heading-like content
-    for tag in soup.find_all(['h1', 'h2', 'h3', 'title']):
-        text = tag.get_text().strip()
-        if text and len(text) < 100 and text not in ['Input', 'Output', 'Constraints', 'Sample Input', 'Sample Output']:
-            return text
+    # Strategy 3: Look for any heading-like content, stopping at the first hit
+    heading = soup.find(_is_title_candidate)
+    if heading:
+        return heading.get_text().strip()
     
     # Strategy 4: Extract from comments
     comment_content = extract_from_comments(soup)
@@ -86,10 +256,8 @@ def extract_title_flexible(soup):
     
     return ""
 
-def extract_sections_from_html_improved(html_content):
+def extract_sections_from_html_improved(soup):
     """Extract structured sections with improved handling"""
-    soup = BeautifulSoup(html_content, 'html.parser')
-    
     sections = {}
     
     # Extract title with flexible approach
@@ -101,12 +269,13 @@ def extract_sections_from_html_improved(html_content):
     description_parts = []
     
     # Strategy 1: Look for content between title and first section
-    first_section = soup.find(['h2', 'h3'], string=re.compile(r'(Input|Constraints|入力|制約)', re.I))
+    first_section = soup.find(['h2', 'h3'], string=_RE_FIRST_SECTION)
     if first_section:
-        current = soup.find('body') if soup.find('body') else soup
-        for element in current.find_all(['p', 'div']):
-            if element.get_text().strip() and not any(section_word in element.get_text() for section_word in ['Input', 'Output', 'Constraints', 'Sample']):
-                description_parts.append(element.get_text().strip())
+        body = soup.find('body') or soup
+        for element in body.find_all(['p', 'div']):
+            text = element.get_text().strip()
+            if text and not any(section_word in text for section_word in _SECTION_WORDS):
+                description_parts.append(text)
     
     # Strategy 2: Extract from comments if main content is sparse
     if len(' '.join(description_parts)) < 50:
@@ -117,46 +286,45 @@ def extract_sections_from_html_improved(html_content):
     # Strategy 3: Look for Problem Statement section (AtCoder)
     problem_statement = soup.find('h3', string='Problem Statement')
     if problem_statement:
-        next_section = problem_statement.find_next(['h3', 'hr'])
-        current = problem_statement.next_sibling
-        while current and current != next_section:
-            if hasattr(current, 'get_text') and current.get_text().strip():
-                description_parts.append(current.get_text().strip())
-            current = current.next_sibling
+        # next_siblings keeps bare text nodes, which carry real content here
+        for sibling in problem_statement.next_siblings:
+            if sibling.name in ('h3', 'hr'):
+                break
+            text = sibling.get_text().strip()
+            if text:
+                description_parts.append(text)
     
     sections['description'] = ' '.join(description_parts)
     
-    # Extract standard sections with multiple language support
-    section_mappings = {
-        'input': ['Input', '入力', 'input'],
-        'output': ['Output', '出力', 'output'],
-        'constraints': ['Constraints', '制約', 'constraints'],
-        'sample input': ['Sample Input', 'Sample Input 1', '入力例', 'sample input'],
-        'sample output': ['Sample Output', 'Sample Output 1', '出力例', 'sample output'],
-    }
-    
-    # Find sections by various headers
-    for section_key, possible_names in section_mappings.items():
-        for name in possible_names:
-            # Look for h2, h3 tags
-            header = soup.find(['h2', 'h3'], string=re.compile(re.escape(name), re.I))
-            if header:
-                content_parts = []
-                current = header.next_sibling
-                
-                # Get content until next header
-                while current:
-                    if hasattr(current, 'name') and current.name and current.name.lower() in ['h2', 'h3']:
-                        break
-                    if hasattr(current, 'get_text'):
-                        text = current.get_text().strip()
-                        if text:
-                            content_parts.append(text)
-                    current = current.next_sibling
-                
-                if content_parts:
-                    sections[section_key] = ' '.join(content_parts)
+    # Find sections in a single pass over the document's headers
+    remaining = set(_SECTION_HEADER_RES)
+    for header in soup.find_all(['h2', 'h3']):
+        if not remaining:
+            break
+
+        header_text = header.get_text().strip()
+        section_key = _NAME_TO_KEY.get(header_text.lower())
+        if section_key is None:
+            # Decorated headers still match the per-section patterns
+            for key in _SECTION_HEADER_RES:
+                if key in remaining and _SECTION_HEADER_RES[key].search(header_text):
+                    section_key = key
                     break
+        if section_key not in remaining:
+            continue
+
+        # Get content until next header
+        content_parts = []
+        for sibling in header.next_siblings:
+            if sibling.name in ('h2', 'h3'):
+                break
+            text = sibling.get_text().strip()
+            if text:
+                content_parts.append(text)
+
+        if content_parts:
+            sections[section_key] = ' '.join(content_parts)
+            remaining.discard(section_key)
     
     return sections
 
@@ -177,229 +345,146 @@ def extract_examples_improved(sections):
     
     return examples
 
-def assess_difficulty_improved(sections, problem_id):
-    """Improved difficulty assessment"""
+def analyze_problem_improved(sections, problem_id):
+    """Assess difficulty, categorize and tag a problem from one keyword scan"""
     content = ' '.join([
         sections.get('title', ''),
         sections.get('description', ''),
         sections.get('constraints', '')
     ]).lower()
-    
+
+    # Single pass over the content; difficulty, category and tags all
+    # bucket the same hit set
+    hits = _find_keywords(content)
+
     # Problem ID based assessment (later problems tend to be harder)
     problem_num = int(problem_id[1:]) if problem_id[1:].isdigit() else 0
-    
-    # Keyword-based assessment
-    easy_keywords = ['sum', 'count', 'simple', 'basic', 'digit', 'print', 'calculate', 'find']
-    medium_keywords = ['algorithm', 'sort', 'search', 'tree', 'graph', 'dynamic', 'optimal', 'sequence']
-    hard_keywords = ['complex', 'advanced', 'polynomial', 'exponential', 'combinatorial', 'optimization']
-    
-    easy_score = sum(1 for kw in easy_keywords if kw in content)
-    medium_score = sum(1 for kw in medium_keywords if kw in content)
-    hard_score = sum(1 for kw in hard_keywords if kw in content)
-    
+
+    easy_score = sum(1 for kw in EASY_KEYWORDS if kw in hits)
+    medium_score = sum(1 for kw in MEDIUM_KEYWORDS if kw in hits)
+    hard_score = sum(1 for kw in HARD_KEYWORDS if kw in hits)
+
     # Constraint-based assessment
     constraints_text = sections.get('constraints', '')
     if '10^9' in constraints_text or '10^8' in constraints_text:
         hard_score += 2
     elif '10^6' in constraints_text or '10^5' in constraints_text:
         medium_score += 1
-    
+
     # Final assessment
     if hard_score > 0 or problem_num > 3500:
-        return "Hard"
+        difficulty = "Hard"
     elif medium_score > easy_score or problem_num > 2000:
-        return "Medium"
+        difficulty = "Medium"
     else:
-        return "Easy"
+        difficulty = "Easy"
 
-def categorize_problem_improved(sections):
-    """Improved problem categorization"""
-    content = ' '.join([
-        sections.get('title', ''),
-        sections.get('description', '')
-    ]).lower()
-    
-    # Enhanced category detection
-    categories = {
-        'Arrays & Strings': ['array', 'string', 'text', 'character', 'sequence', 'list'],
-        'Math & Logic': ['math', 'number', 'digit', 'calculate', 'formula', 'equation', 'arithmetic'],
-        'Geometry': ['triangle', 'circle', 'coordinate', 'distance', 'angle', 'geometry', 'point'],
-        'Sorting & Searching': ['sort', 'search', 'find', 'order', 'binary search', 'maximum', 'minimum'],
-        'Dynamic Programming': ['dynamic', 'dp', 'optimization', 'optimal', 'recursive'],
-        'Trees & Graphs': ['tree', 'graph', 'node', 'edge', 'path', 'traversal', 'connected'],
-        'Greedy Algorithms': ['greedy', 'optimal choice', 'interval'],
-        'Simulation': ['simulate', 'game', 'step', 'process', 'move'],
-        'Implementation': ['implement', 'program', 'algorithm', 'output', 'print']
-    }
-    
+    # Category with the highest keyword score wins
     best_category = 'Implementation'
     max_score = 0
-    
-    for category, keywords in categories.items():
-        score = sum(1 for keyword in keywords if keyword in content)
+
+    for category, keywords in CATEGORY_KEYWORDS.items():
+        score = sum(1 for keyword in keywords if keyword in hits)
         if score > max_score:
             max_score = score
             best_category = category
-    
-    return best_category
+
+    # Generate tags
+    tags = [tag for tag, keywords in TAG_KEYWORDS.items()
+            if any(keyword in hits for keyword in keywords)]
+    if not tags:
+        tags = ['implementation']
+
+    return difficulty, best_category, tags
 
 def extract_problem_improved(file_path):
     """Extract problem with improved handling of edge cases"""
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            html_content = f.read()
-        
-        if not html_content.strip():
-            return None
-        
-        problem_id = Path(file_path).stem
-        
-        # Parse with improved extraction
-        sections = extract_sections_from_html_improved(html_content)
-        
-        # Require at least some content
-        if not sections.get('title') and not sections.get('description'):
-            return None
-        
-        # Use problem ID as title if no title found
-        if not sections.get('title'):
-            sections['title'] = f"Problem {problem_id}"
-        
-        # Extract other components
-        examples = extract_examples_improved(sections)
-        difficulty = assess_difficulty_improved(sections, problem_id)
-        category = categorize_problem_improved(sections)
-        
-        # Generate tags
-        tags = []
-        content_lower = (sections.get('description', '') + ' ' + sections.get('title', '')).lower()
-        
-        tag_keywords = {
-            'array': ['array', 'list', 'sequence'],
-            'string': ['string', 'text', 'character'],
-            'math': ['math', 'number', 'calculation', 'arithmetic'],
-            'geometry': ['triangle', 'circle', 'coordinate', 'geometry'],
-            'sorting': ['sort', 'order', 'maximum', 'minimum'],
-            'graph': ['graph', 'tree', 'node', 'path'],
-            'simulation': ['simulate', 'game', 'process'],
-            'implementation': ['implement', 'program', 'output']
-        }
-        
-        for tag, keywords in tag_keywords.items():
-            if any(keyword in content_lower for keyword in keywords):
-                tags.append(tag)
-        
-        if not tags:
-            tags = ['implementation']
-        
-        # Build constraints
-        constraints = {
-            "timeLimit": None,
-            "memoryLimit": None,
-            "inputConstraints": {
-                "description": sections.get('constraints', ''),
-                "ranges": ""
-            },
-            "languageRestrictions": []
-        }
-        
-        # Extract ranges from constraints
-        constraints_text = sections.get('constraints', '')
-        if constraints_text:
-            range_patterns = [
-                r'(\d+)\s*[≤<=]\s*\w+\s*[≤<=]\s*(\d+)',
-                r'\w+\s*[≤<=]\s*(\d+)',
-                r'(\d+)\s*[≤<=]\s*\w+'
-            ]
-            
-            ranges = []
-            for pattern in range_patterns:
-                matches = re.findall(pattern, constraints_text)
-                ranges.extend([' '.join(match) if isinstance(match, tuple) else str(match) for match in matches])
-            
-            if ranges:
-                constraints["inputConstraints"]["ranges"] = '; '.join(ranges)
-        
-        # Generate code templates
-        templates = {
-            'python': '''def solve():
-    # Read input
-    # Process data
-    # Output result
-    pass
+        raw = Path(file_path).read_bytes()
+    except OSError as e:
+        print(f"Error reading {file_path}: {e}")
+        return None
 
-if __name__ == "__main__":
-    solve()''',
-            
-            'cpp': '''#include <iostream>
-#include <vector>
-#include <string>
-using namespace std;
+    # Cheap byte-level prefilter: skip stub files and files with no
+    # markup at all before paying for a full parse
+    if len(raw) < 64 or b'<' not in raw:
+        return None
 
-int main() {
-    // Read input
-    // Process data
-    // Output result
-    return 0;
-}''',
-            
-            'java': '''import java.util.*;
-import java.io.*;
+    html_content = raw.decode('utf-8', errors='ignore')
 
-public class Solution {
-    public static void main(String[] args) {
-        Scanner sc = new Scanner(System.in);
-        // Read input
-        // Process data
-        // Output result
-        sc.close();
+    problem_id = Path(file_path).stem
+
+    # Parse the HTML once and reuse the tree everywhere
+    soup = BeautifulSoup(html_content, HTML_PARSER)
+    sections = extract_sections_from_html_improved(soup)
+
+    title = sections.get('title', '')
+    description = sections.get('description', '')
+    constraints_text = sections.get('constraints', '')
+
+    # Require at least some content
+    if not title and not description:
+        return None
+
+    # Use problem ID as title if no title found
+    if not title:
+        title = f"Problem {problem_id}"
+        sections['title'] = title
+
+    # Extract other components
+    examples = extract_examples_improved(sections)
+    difficulty, category, tags = analyze_problem_improved(sections, problem_id)
+
+    # Build constraints
+    constraints = {
+        "timeLimit": None,
+        "memoryLimit": None,
+        "inputConstraints": {
+            "description": constraints_text,
+            "ranges": ""
+        },
+        "languageRestrictions": []
     }
-}''',
-            
-            'javascript': '''function solve() {
-    // Read input
-    // Process data
-    // Output result
-}
 
-solve();'''
-        }
-        
-        # Calculate confidence score
-        confidence = 0.5  # Base confidence
-        if sections.get('title'): confidence += 0.1
-        if sections.get('description') and len(sections['description']) > 50: confidence += 0.2
-        if examples["sampleCases"]: confidence += 0.2
-        if sections.get('constraints'): confidence += 0.1
-        
-        confidence = min(confidence, 1.0)
-        
-        # Build final problem object
-        problem = {
-            "basicInfo": {
-                "questionId": problem_id,
-                "title": sections.get('title', f"Problem {problem_id}"),
-                "description": sections.get('description', ''),
-                "difficulty": difficulty,
-                "category": category,
-                "tags": tags,
-                "source": str(file_path)
-            },
-            "constraints": constraints,
-            "examples": examples,
-            "codeTemplates": templates,
-            "metadata": {
-                "extractedFrom": str(file_path),
-                "confidence": confidence,
-                "notes": f"Extracted from Project CodeNet problem {problem_id}"
-            }
+    # Extract ranges from constraints
+    if constraints_text:
+        ranges = [' '.join(group for group in match.groups() if group)
+                  for match in _RE_RANGE.finditer(constraints_text)]
+
+        if ranges:
+            constraints["inputConstraints"]["ranges"] = '; '.join(ranges)
+
+    # Calculate confidence score
+    confidence = 0.5  # Base confidence
+    if title: confidence += 0.1
+    if description and len(description) > 50: confidence += 0.2
+    if examples["sampleCases"]: confidence += 0.2
+    if constraints_text: confidence += 0.1
+
+    confidence = min(confidence, 1.0)
+
+    # Build final problem object
+    problem = {
+        "basicInfo": {
+            "questionId": problem_id,
+            "title": title,
+            "description": description,
+            "difficulty": difficulty,
+            "category": category,
+            "tags": tags,
+            "source": str(file_path)
+        },
+        "constraints": constraints,
+        "examples": examples,
+        "codeTemplates": CODE_TEMPLATES,
+        "metadata": {
+            "extractedFrom": str(file_path),
+            "confidence": confidence,
+            "notes": f"Extracted from Project CodeNet problem {problem_id}"
         }
-        
-        return problem
-        
-    except Exception as e:
-        print(f"Error processing {file_path}: {e}")
-        return None
+    }
+
+    return problem
 
 def main():
     """Main function to extract all problems with improved handling"""
@@ -412,58 +497,62 @@ def main():
     
     print(f"Extracting problems from: {problems_dir}")
     
-    html_files = list(problems_dir.glob("p*.html"))
+    # Plain scandir + string sort; avoids building and comparing Path objects
+    with os.scandir(problems_dir) as entries:
+        html_files = sorted(
+            entry.path for entry in entries
+            if entry.name.startswith('p') and entry.name.endswith('.html')
+        )
     print(f"Found {len(html_files)} problem files")
     
-    problems = []
-    processed = 0
+    extracted = 0
     skipped = 0
-    
-    for html_file in sorted(html_files):
-        if processed % 100 == 0:
-            print(f"Processed {processed}/{len(html_files)} problems... (skipped: {skipped})")
-        
-        problem = extract_problem_improved(html_file)
-        if problem:
-            problems.append(problem)
-        else:
-            skipped += 1
-        
-        processed += 1
-    
-    print(f"Successfully extracted {len(problems)} problems (skipped {skipped})")
-    
-    # Create output JSON
-    output = {"problems": problems}
-    
-    # Write to file
+
+    # Summary statistics as columns; counted in bulk after the loop
+    difficulties_col = []
+    categories_col = []
+    confidences_col = []
+
     output_file = base_dir / "extracted_problems_complete.json"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
-    
+
+    # Each file is independent and CPU-bound, so spread them across cores.
+    # Stream each problem straight to disk instead of holding them all in memory.
+    with open(output_file, 'w', encoding='utf-8') as f, \
+         ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        f.write('{"problems": [')
+
+        for processed, problem in enumerate(executor.map(extract_problem_improved, html_files, chunksize=32)):
+            if processed % 100 == 0:
+                print(f"Processed {processed}/{len(html_files)} problems... (skipped: {skipped})")
+
+            if not problem:
+                skipped += 1
+                continue
+
+            if extracted:
+                f.write(',\n')
+            f.write(_dumps(problem))
+            extracted += 1
+
+            basic_info = problem["basicInfo"]
+            difficulties_col.append(basic_info["difficulty"])
+            categories_col.append(basic_info["category"])
+            confidences_col.append(problem["metadata"]["confidence"])
+
+        f.write(']}')
+
+    difficulties = Counter(difficulties_col)
+    categories = Counter(categories_col)
+    confidence_levels = {
+        'high': sum(1 for conf in confidences_col if conf >= 0.8),
+        'medium': sum(1 for conf in confidences_col if 0.6 <= conf < 0.8),
+        'low': sum(1 for conf in confidences_col if conf < 0.6),
+    }
+
+    print(f"Successfully extracted {extracted} problems (skipped {skipped})")
     print(f"Saved all problems to: {output_file}")
-    print(f"Total problems extracted: {len(problems)}")
-    
-    # Print summary statistics
-    difficulties = {}
-    categories = {}
-    confidence_levels = {'high': 0, 'medium': 0, 'low': 0}
-    
-    for problem in problems:
-        diff = problem["basicInfo"]["difficulty"]
-        cat = problem["basicInfo"]["category"]
-        conf = problem["metadata"]["confidence"]
-        
-        difficulties[diff] = difficulties.get(diff, 0) + 1
-        categories[cat] = categories.get(cat, 0) + 1
-        
-        if conf >= 0.8:
-            confidence_levels['high'] += 1
-        elif conf >= 0.6:
-            confidence_levels['medium'] += 1
-        else:
-            confidence_levels['low'] += 1
-    
+    print(f"Total problems extracted: {extracted}")
+
     print("\nDifficulty distribution:")
     for diff, count in sorted(difficulties.items()):
         print(f"  {diff}: {count}")
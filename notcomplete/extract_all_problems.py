@@ -8,93 +8,229 @@ import os
 import json
 import re
 from bs4 import BeautifulSoup
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Pool
 from pathlib import Path
 import sys
 
+# Use lxml's C-based parser when installed; html.parser otherwise
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# orjson is a C extension, far faster than the stdlib json encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps(obj):
+    """Serialize to a compact JSON string with the fastest encoder available"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False)
+
+_WS_RE = re.compile(r'\s+')
+
+# Quick raw-HTML probe for an H1; files without one carry no title and
+# would be discarded after a full parse anyway
+_H1_RE = re.compile(rb'<h1[\s>]', re.I)
+
+# "Problem X: " prefixes stripped from titles, for any letter
+_TITLE_PREFIX_RE = re.compile(r'^Problem [A-Z]: ')
+
+# Patterns for extracting numeric ranges from constraints text
+_RANGE_PATTERNS = [
+    re.compile(r'(\d+)\s*[≤<=]\s*\w+\s*[≤<=]\s*(\d+)'),
+    re.compile(r'\w+\s*[≤<=]\s*(\d+)'),
+    re.compile(r'(\d+)\s*[≤<=]\s*\w+'),
+]
+
+# Category mapping based on keywords
+CATEGORY_KEYWORDS = {
+    'Arrays & Strings': ['array', 'string', 'text', 'character', 'sequence'],
+    'Math & Logic': ['math', 'number', 'digit', 'calculate', 'formula', 'equation'],
+    'Geometry': ['triangle', 'circle', 'coordinate', 'distance', 'angle', 'geometry'],
+    'Sorting & Searching': ['sort', 'search', 'find', 'order', 'binary search'],
+    'Dynamic Programming': ['dynamic', 'dp', 'optimization', 'maximum', 'minimum'],
+    'Trees & Graphs': ['tree', 'graph', 'node', 'edge', 'path', 'traversal'],
+    'Greedy Algorithms': ['greedy', 'optimal', 'choice'],
+    'Simulation': ['simulate', 'game', 'step', 'process'],
+    'Implementation': ['implement', 'program', 'algorithm']
+}
+
+TAG_KEYWORDS = {
+    'array': ['array', 'list'],
+    'string': ['string', 'text', 'character'],
+    'math': ['math', 'number', 'calculation'],
+    'geometry': ['triangle', 'circle', 'coordinate'],
+    'sorting': ['sort', 'order'],
+    'graph': ['graph', 'tree', 'node'],
+    'simulation': ['simulate', 'game'],
+    'implementation': ['implement', 'program']
+}
+
+# pyahocorasick matches every keyword in one linear scan of the content
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+_ALL_KEYWORDS = set()
+for _keywords in CATEGORY_KEYWORDS.values():
+    _ALL_KEYWORDS.update(_keywords)
+for _keywords in TAG_KEYWORDS.values():
+    _ALL_KEYWORDS.update(_keywords)
+
+def _build_keyword_automaton():
+    """Build an Aho-Corasick automaton over the category/tag keywords"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in _ALL_KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+def _find_keywords(content_lower):
+    """Return the set of known keywords found in the content"""
+    if _KEYWORD_AUTOMATON is not None:
+        return {keyword for _, keyword in _KEYWORD_AUTOMATON.iter(content_lower)}
+    # Fallback: per-keyword substring scans
+    return {keyword for keyword in _ALL_KEYWORDS if keyword in content_lower}
+
+def _normalize_ws(text):
+    """Collapse all whitespace runs to single spaces"""
+    return _WS_RE.sub(' ', text).strip() if text else ""
+
 def clean_html_text(html_content):
     """Clean HTML content and extract plain text"""
     if not html_content:
         return ""
-    
+
     # Parse HTML
-    soup = BeautifulSoup(html_content, 'html.parser')
-    
+    soup = BeautifulSoup(html_content, HTML_PARSER)
+
     # Remove script and style elements
     for script in soup(["script", "style"]):
         script.decompose()
-    
+
     # Get text and clean it
-    text = soup.get_text()
-    
-    # Clean up whitespace
-    lines = (line.strip() for line in text.splitlines())
-    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-    text = ' '.join(chunk for chunk in chunks if chunk)
-    
-    return text
+    return _normalize_ws(soup.get_text())
 
 def extract_sections_from_html(html_content):
     """Extract structured sections from HTML problem description"""
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = BeautifulSoup(html_content, HTML_PARSER)
     
     sections = {}
     
     # Extract title
     title_tag = soup.find('h1')
     if title_tag:
-        sections['title'] = clean_html_text(str(title_tag))
+        sections['title'] = _normalize_ws(title_tag.get_text())
     
     # Extract problem description (everything before first H2)
     description_parts = []
-    current = title_tag.next_sibling if title_tag else soup.find('body')
-    
-    while current:
-        if hasattr(current, 'name') and current.name and current.name.lower() == 'h2':
-            break
-        if hasattr(current, 'get_text'):
-            text = current.get_text().strip()
+    if title_tag:
+        # next_siblings (not find_next_siblings) so bare text nodes between
+        # tags are kept; they carry real content in this corpus
+        for sibling in title_tag.next_siblings:
+            if sibling.name == 'h2':
+                break
+            text = sibling.get_text().strip()
             if text:
                 description_parts.append(text)
-        elif isinstance(current, str) and current.strip():
-            description_parts.append(current.strip())
-        current = current.next_sibling
-    
+    else:
+        body = soup.find('body')
+        if body:
+            text = body.get_text().strip()
+            if text:
+                description_parts.append(text)
+
     sections['description'] = ' '.join(description_parts)
     
+    # Special section keys noted during the walk, so downstream helpers
+    # don't have to re-scan the whole sections dict
+    special_keys = {'sample inputs': [], 'sample outputs': [], 'constraints': []}
+
     # Extract all H2 sections
     h2_tags = soup.find_all('h2')
     current_section = None
-    
+
     for h2 in h2_tags:
-        section_name = clean_html_text(str(h2)).lower()
+        section_name = _normalize_ws(h2.get_text()).lower()
+        if section_name not in sections:
+            # Check outputs first: "output for the sample input" contains
+            # "sample input" and must not be misfiled as an input
+            if 'output for' in section_name or 'sample output' in section_name:
+                special_keys['sample outputs'].append(section_name)
+            elif 'sample input' in section_name:
+                special_keys['sample inputs'].append(section_name)
+            elif 'constraint' in section_name:
+                special_keys['constraints'].append(section_name)
         sections[section_name] = ""
-        
+
         # Get content until next H2 or end
-        current = h2.next_sibling
         content_parts = []
-        
-        while current:
-            if hasattr(current, 'name') and current.name and current.name.lower() == 'h2':
+
+        for sibling in h2.next_siblings:
+            if sibling.name == 'h2':
                 break
-            if hasattr(current, 'get_text'):
-                text = current.get_text().strip()
-                if text:
-                    content_parts.append(text)
-            elif isinstance(current, str) and current.strip():
-                content_parts.append(current.strip())
-            current = current.next_sibling
-        
+            text = sibling.get_text().strip()
+            if text:
+                content_parts.append(text)
+
         sections[section_name] = ' '.join(content_parts)
-    
-    return sections
 
-def extract_examples_from_sections(sections):
+    return sections, special_keys
+
+def extract_examples_from_sections(sections, special_keys):
     """Extract input/output examples from sections"""
     examples = {"sampleCases": [], "testCases": []}
-    
-    # Look for sample input/output pairs
-    sample_input_keys = [k for k in sections.keys() if 'sample input' in k.lower()]
-    sample_output_keys = [k for k in sections.keys() if ('output for' in k.lower() or 'sample output' in k.lower())]
+
+    # Fast path: most pages number their samples with literal
+    # "Sample Input N" / "Sample Output N" headers, so probe those keys
+    # directly until the first miss
+    i = 1
+    while True:
+        # Some pages drop the space before the number ("Sample Output2"),
+        # so probe both spellings
+        input_text = sections.get(f'sample input {i}')
+        if input_text is None:
+            input_text = sections.get(f'sample input{i}')
+        output_text = sections.get(f'sample output {i}')
+        if output_text is None:
+            output_text = sections.get(f'sample output{i}')
+        if output_text is None:
+            output_text = sections.get(f'output for sample input {i}')
+        if output_text is None:
+            output_text = sections.get(f'output for the sample input {i}')
+
+        if input_text is None and output_text is None:
+            break
+
+        input_text = (input_text or "").strip()
+        output_text = (output_text or "").strip()
+        if input_text or output_text:
+            examples["sampleCases"].append({
+                "input": input_text,
+                "output": output_text,
+                "explanation": ""
+            })
+        i += 1
+
+    if examples["sampleCases"]:
+        return examples
+
+    # Fallback for unnumbered samples: pair the keys indexed during the
+    # section walk in document order
+    sample_input_keys = special_keys['sample inputs']
+    sample_output_keys = special_keys['sample outputs']
     
     # Pair up inputs and outputs
     for i, input_key in enumerate(sample_input_keys):
@@ -114,7 +250,7 @@ def extract_examples_from_sections(sections):
     
     return examples
 
-def extract_constraints_from_sections(sections):
+def extract_constraints_from_sections(sections, special_keys):
     """Extract constraints from sections"""
     constraints = {
         "timeLimit": None,
@@ -125,27 +261,18 @@ def extract_constraints_from_sections(sections):
         },
         "languageRestrictions": []
     }
-    
-    # Look for constraints section
-    constraints_text = ""
-    for key, value in sections.items():
-        if 'constraint' in key.lower():
-            constraints_text = value
-            break
+
+    # The constraints keys were indexed during the section walk
+    constraint_keys = special_keys['constraints']
+    constraints_text = sections.get(constraint_keys[0], "") if constraint_keys else ""
     
     if constraints_text:
         constraints["inputConstraints"]["description"] = constraints_text
         
         # Try to extract ranges using regex
-        range_patterns = [
-            r'(\d+)\s*[≤<=]\s*\w+\s*[≤<=]\s*(\d+)',
-            r'\w+\s*[≤<=]\s*(\d+)',
-            r'(\d+)\s*[≤<=]\s*\w+'
-        ]
-        
         ranges = []
-        for pattern in range_patterns:
-            matches = re.findall(pattern, constraints_text)
+        for pattern in _RANGE_PATTERNS:
+            matches = pattern.findall(constraints_text)
             ranges.extend([' '.join(match) if isinstance(match, tuple) else str(match) for match in matches])
         
         if ranges:
@@ -153,62 +280,43 @@ def extract_constraints_from_sections(sections):
     
     return constraints
 
-def assess_difficulty(sections, problem_id):
+def assess_difficulty(content_lower, problem_num):
     """Assess problem difficulty based on content analysis"""
-    description = sections.get('description', '') + ' ' + sections.get('title', '')
-    description_lower = description.lower()
-    
     # Simple heuristics for difficulty assessment
     easy_indicators = ['sum', 'count', 'simple', 'basic', 'digit', 'triangle', 'maximum', 'minimum']
     medium_indicators = ['algorithm', 'sort', 'search', 'tree', 'graph', 'dynamic', 'optimization']
     hard_indicators = ['complex', 'advanced', 'polynomial', 'np-hard', 'exponential', 'combinatorial']
-    
-    easy_score = sum(1 for indicator in easy_indicators if indicator in description_lower)
-    medium_score = sum(1 for indicator in medium_indicators if indicator in description_lower)
-    hard_score = sum(1 for indicator in hard_indicators if indicator in description_lower)
-    
-    # Also consider problem ID (later problems tend to be harder)
-    problem_num = int(problem_id[1:]) if problem_id[1:].isdigit() else 0
-    
-    if hard_score > 0 or problem_num > 3000:
+
+    # Hard is a presence check, so short-circuit on the first hit
+    # (later problems also tend to be harder)
+    if problem_num > 3000 or any(indicator in content_lower for indicator in hard_indicators):
         return "Hard"
-    elif medium_score > easy_score or problem_num > 1000:
+
+    easy_score = sum(1 for indicator in easy_indicators if indicator in content_lower)
+    medium_score = sum(1 for indicator in medium_indicators if indicator in content_lower)
+
+    if medium_score > easy_score or problem_num > 1000:
         return "Medium"
     else:
         return "Easy"
 
-def categorize_problem(sections):
-    """Categorize problem based on content"""
-    content = (sections.get('description', '') + ' ' + sections.get('title', '')).lower()
-    
-    # Category mapping based on keywords
-    categories = {
-        'Arrays & Strings': ['array', 'string', 'text', 'character', 'sequence'],
-        'Math & Logic': ['math', 'number', 'digit', 'calculate', 'formula', 'equation'],
-        'Geometry': ['triangle', 'circle', 'coordinate', 'distance', 'angle', 'geometry'],
-        'Sorting & Searching': ['sort', 'search', 'find', 'order', 'binary search'],
-        'Dynamic Programming': ['dynamic', 'dp', 'optimization', 'maximum', 'minimum'],
-        'Trees & Graphs': ['tree', 'graph', 'node', 'edge', 'path', 'traversal'],
-        'Greedy Algorithms': ['greedy', 'optimal', 'choice'],
-        'Simulation': ['simulate', 'game', 'step', 'process'],
-        'Implementation': ['implement', 'program', 'algorithm']
-    }
-    
+def categorize_problem(keyword_hits):
+    """Categorize problem based on the keywords found in its content"""
     best_category = 'Implementation'  # default
     max_score = 0
-    
-    for category, keywords in categories.items():
-        score = sum(1 for keyword in keywords if keyword in content)
+
+    for category, keywords in CATEGORY_KEYWORDS.items():
+        score = sum(1 for keyword in keywords if keyword in keyword_hits)
         if score > max_score:
             max_score = score
             best_category = category
     
     return best_category
 
-def generate_code_template(sections, language):
-    """Generate basic code template for the problem"""
-    templates = {
-        'python': '''def solve():
+# Templates are the same for every problem, so build the dict once and
+# share it across all problem objects
+_CODE_TEMPLATES = {
+    'python': '''def solve():
     # Read input
     # Process data
     # Output result
@@ -216,8 +324,8 @@ def generate_code_template(sections, language):
 
 if __name__ == "__main__":
     solve()''',
-        
-        'cpp': '''#include <iostream>
+
+    'cpp': '''#include <iostream>
 #include <vector>
 #include <string>
 using namespace std;
@@ -228,8 +336,8 @@ int main() {
     // Output result
     return 0;
 }''',
-        
-        'java': '''import java.util.*;
+
+    'java': '''import java.util.*;
 import java.io.*;
 
 public class Solution {
@@ -241,59 +349,67 @@ public class Solution {
         sc.close();
     }
 }''',
-        
-        'javascript': '''function solve() {
+
+    'javascript': '''function solve() {
     // Read input
     // Process data
     // Output result
 }
 
 solve();'''
-    }
-    
-    return templates.get(language, templates['python'])
+}
 
-def extract_problem_from_html_file(file_path):
-    """Extract a single problem from HTML file"""
+def generate_code_template(sections, language):
+    """Generate basic code template for the problem"""
+    return _CODE_TEMPLATES.get(language, _CODE_TEMPLATES['python'])
+
+def extract_problem_from_html(file_path, html_content):
+    """Extract a single problem from raw HTML bytes"""
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            html_content = f.read()
-        
         if not html_content.strip():
             return None
         
-        # Extract problem ID from filename
+        # Extract problem ID from filename (pNNNNN-style)
+        path_str = str(file_path)
         problem_id = Path(file_path).stem
+        try:
+            problem_num = int(problem_id[1:])
+        except ValueError:
+            problem_num = 0
         
+        # No <h1> means no title, which gets rejected below; checking the
+        # raw HTML first skips the whole DOM build for those files
+        if not _H1_RE.search(html_content):
+            return None
+
         # Parse HTML and extract sections
-        sections = extract_sections_from_html(html_content)
-        
-        if not sections.get('title'):
+        sections, special_keys = extract_sections_from_html(html_content)
+
+        title = sections.get('title', '')
+        description = sections.get('description', '')
+
+        if not title:
             return None
-        
+
         # Extract structured information
-        examples = extract_examples_from_sections(sections)
-        constraints = extract_constraints_from_sections(sections)
-        difficulty = assess_difficulty(sections, problem_id)
-        category = categorize_problem(sections)
-        
+        examples = extract_examples_from_sections(sections, special_keys)
+        constraints = extract_constraints_from_sections(sections, special_keys)
+
+        # Lowercase the searchable content once and share it with the
+        # difficulty, category and tag passes
+        content_lower = f"{description} {title}".lower()
+
+        # One keyword scan feeds both categorization and tagging
+        keyword_hits = _find_keywords(content_lower)
+
+        difficulty = assess_difficulty(content_lower, problem_num)
+        category = categorize_problem(keyword_hits)
+
         # Generate tags
         tags = []
-        content_lower = (sections.get('description', '') + ' ' + sections.get('title', '')).lower()
-        
-        tag_keywords = {
-            'array': ['array', 'list'],
-            'string': ['string', 'text', 'character'],
-            'math': ['math', 'number', 'calculation'],
-            'geometry': ['triangle', 'circle', 'coordinate'],
-            'sorting': ['sort', 'order'],
-            'graph': ['graph', 'tree', 'node'],
-            'simulation': ['simulate', 'game'],
-            'implementation': ['implement', 'program']
-        }
-        
-        for tag, keywords in tag_keywords.items():
-            if any(keyword in content_lower for keyword in keywords):
+
+        for tag, keywords in TAG_KEYWORDS.items():
+            if any(keyword in keyword_hits for keyword in keywords):
                 tags.append(tag)
         
         if not tags:
@@ -303,24 +419,19 @@ def extract_problem_from_html_file(file_path):
         problem = {
             "basicInfo": {
                 "questionId": problem_id,
-                "title": sections.get('title', f"Problem {problem_id}").replace('Problem F: ', '').replace('Problem A: ', ''),
-                "description": sections.get('description', ''),
+                "title": _TITLE_PREFIX_RE.sub('', title),
+                "description": description,
                 "difficulty": difficulty,
                 "category": category,
                 "tags": tags,
-                "source": str(file_path)
+                "source": path_str
             },
             "constraints": constraints,
             "examples": examples,
-            "codeTemplates": {
-                "python": generate_code_template(sections, 'python'),
-                "cpp": generate_code_template(sections, 'cpp'),
-                "java": generate_code_template(sections, 'java'),
-                "javascript": generate_code_template(sections, 'javascript')
-            },
+            "codeTemplates": _CODE_TEMPLATES,
             "metadata": {
-                "extractedFrom": str(file_path),
-                "confidence": 0.8 if sections.get('description') and examples["sampleCases"] else 0.6,
+                "extractedFrom": path_str,
+                "confidence": 0.8 if description and examples["sampleCases"] else 0.6,
                 "notes": f"Extracted from Project CodeNet problem {problem_id}"
             }
         }
@@ -331,6 +442,40 @@ def extract_problem_from_html_file(file_path):
         print(f"Error processing {file_path}: {e}")
         return None
 
+def extract_problem_from_html_file(file_path):
+    """Extract a single problem from HTML file"""
+    try:
+        # Read raw bytes; BeautifulSoup/lxml detect the encoding and
+        # decode during parsing in C, so no Python-level decode pass
+        html_content = Path(file_path).read_bytes()
+    except OSError as e:
+        print(f"Error reading {file_path}: {e}")
+        return None
+    return extract_problem_from_html(file_path, html_content)
+
+def _extract_task(args):
+    """Pool worker: unpack a prefetched (path, bytes) pair"""
+    return extract_problem_from_html(*args)
+
+def _prefetch_reads(paths, depth):
+    """Yield (path, bytes) pairs, reading ahead on a small thread pool"""
+    with ThreadPoolExecutor(max_workers=8) as io_pool:
+        pending = deque()
+        for path in paths:
+            pending.append((path, io_pool.submit(Path(path).read_bytes)))
+            if len(pending) >= depth:
+                ready_path, future = pending.popleft()
+                try:
+                    yield ready_path, future.result()
+                except OSError as e:
+                    print(f"Error reading {ready_path}: {e}")
+        while pending:
+            ready_path, future = pending.popleft()
+            try:
+                yield ready_path, future.result()
+            except OSError as e:
+                print(f"Error reading {ready_path}: {e}")
+
 def main():
     """Main function to extract all problems"""
     # Find problem descriptions directory
@@ -347,43 +492,49 @@ def main():
     html_files = list(problems_dir.glob("p*.html"))
     print(f"Found {len(html_files)} problem files")
     
-    problems = []
+    extracted = 0
     processed = 0
-    
-    for html_file in sorted(html_files):
-        if processed % 100 == 0:
-            print(f"Processed {processed}/{len(html_files)} problems...")
-        
-        problem = extract_problem_from_html_file(html_file)
-        if problem:
-            problems.append(problem)
-        
-        processed += 1
-    
-    print(f"Successfully extracted {len(problems)} problems")
-    
-    # Create output JSON
-    output = {"problems": problems}
-    
-    # Write to file
-    output_file = base_dir / "extracted_problems.json"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
-    
-    print(f"Saved all problems to: {output_file}")
-    print(f"Total problems extracted: {len(problems)}")
-    
-    # Print summary statistics
+
+    # Summary statistics, gathered while streaming
     difficulties = {}
     categories = {}
-    
-    for problem in problems:
-        diff = problem["basicInfo"]["difficulty"]
-        cat = problem["basicInfo"]["category"]
-        
-        difficulties[diff] = difficulties.get(diff, 0) + 1
-        categories[cat] = categories.get(cat, 0) + 1
-    
+
+    output_file = base_dir / "extracted_problems.json"
+
+    # Each file is independent and CPU-bound, so fan out across all cores.
+    # File bytes are prefetched on a thread pool so reads overlap with
+    # parsing; results stream straight to disk instead of being held in a
+    # full in-memory list (plus its serialized copy).
+    reads = _prefetch_reads(sorted(html_files), depth=64)
+
+    with open(output_file, 'w', encoding='utf-8') as f, Pool(os.cpu_count()) as pool:
+        f.write('{"problems": [\n')
+
+        for problem in pool.imap_unordered(_extract_task, reads, chunksize=32):
+            if processed % 100 == 0:
+                print(f"Processed {processed}/{len(html_files)} problems...")
+
+            processed += 1
+            if not problem:
+                continue
+
+            if extracted:
+                f.write(',\n')
+            f.write(_dumps(problem))
+            extracted += 1
+
+            diff = problem["basicInfo"]["difficulty"]
+            cat = problem["basicInfo"]["category"]
+
+            difficulties[diff] = difficulties.get(diff, 0) + 1
+            categories[cat] = categories.get(cat, 0) + 1
+
+        f.write('\n]}')
+
+    print(f"Successfully extracted {extracted} problems")
+    print(f"Saved all problems to: {output_file}")
+    print(f"Total problems extracted: {extracted}")
+
     print("\nDifficulty distribution:")
     for diff, count in sorted(difficulties.items()):
         print(f"  {diff}: {count}")